@@ -0,0 +1,50 @@
+"""Helpers for walking paginated Opinion SDK endpoints."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List
+
+
+def iter_pages(
+    fetch_page: Callable[[int], List[Dict[str, Any]]],
+    *,
+    limit: int,
+    window: int = 4,
+    start_page: int = 1,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages in order while keeping up to ``window`` requests in flight.
+
+    Iteration stops at the first empty page or the first page holding fewer
+    than ``limit`` rows; requests already issued past that point are discarded.
+    """
+
+    if window <= 1:
+        page = start_page
+        while True:
+            rows = fetch_page(page)
+            if not rows:
+                return
+            yield rows
+            if len(rows) < limit:
+                return
+            page += 1
+
+    executor = ThreadPoolExecutor(max_workers=window)
+    try:
+        pending: Deque[Future] = deque(
+            executor.submit(fetch_page, page) for page in range(start_page, start_page + window)
+        )
+        next_page = start_page + window
+        while pending:
+            rows = pending.popleft().result()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < limit:
+                return
+            pending.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
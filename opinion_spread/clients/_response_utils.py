@@ -2,55 +2,165 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, Iterable, List
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 
-_PRIMITIVE_TYPES = (str, int, float, bool)
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
 
 
-def _normalize(value: Any) -> Any:
-    if value is None or isinstance(value, _PRIMITIVE_TYPES):
-        return value
-    if isinstance(value, Decimal):
-        return str(value)
-    if isinstance(value, Enum):
-        return _normalize(value.value)
-    if isinstance(value, dict):
-        return {key: _normalize(val) for key, val in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [_normalize(item) for item in value]
-    if is_dataclass(value):
-        return _normalize(asdict(value))
-    if hasattr(value, "dict") and callable(value.dict):
-        return _normalize(value.dict())  # type: ignore[no-any-return]
-    if hasattr(value, "model_dump") and callable(value.model_dump):
-        return _normalize(value.model_dump())
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _normalize_dict(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {key: _normalize(val) for key, val in value.items()}
+
+
+def _normalize_list(value: Iterable[Any]) -> List[Any]:
+    plain = _PLAIN_TYPES
+    if all(type(item) in plain for item in value):
+        return value if type(value) is list else list(value)
+    return list(map(_normalize, value))
+
+
+def _normalize_enum(value: Enum) -> Any:
+    return _normalize(value.value)
+
+
+def _normalize_dataclass(value: Any) -> Dict[str, Any]:
+    cls = type(value)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES.setdefault(cls, tuple(f.name for f in fields(cls)))
+    return {name: _normalize(getattr(value, name)) for name in names}
+
+
+def _public_attributes(value: Any) -> Dict[str, Any]:
+    return {
+        key: val
+        for key, val in value.__dict__.items()
+        if not key.startswith("_")
+    }
+
+
+def _build_extractor(value: Any) -> Optional[Callable[[Any], Any]]:
+    """Inspect ``type(value)`` once and return how to turn instances into data."""
+
+    if callable(getattr(value, "model_dump", None)):
+        return methodcaller("model_dump")
+    if callable(getattr(value, "dict", None)):
+        return methodcaller("dict")
     if hasattr(value, "__dict__"):
-        data = {
-            key: val
-            for key, val in value.__dict__.items()
-            if not key.startswith("_")
-        }
-        if data:
-            return _normalize(data)
+        return _public_attributes
+    return None
+
+
+def _normalize_attributes(value: Any) -> Any:
+    data = _public_attributes(value)
+    if data:
+        return _normalize(data)
     return value
 
 
-def extract_list(response: Any) -> List[Dict[str, Any]]:
+def _object_handler(extractor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if extractor is _public_attributes:
+        return _normalize_attributes
+
+    def handler(value: Any) -> Any:
+        return _normalize(extractor(value))
+
+    return handler
+
+
+# Handlers registered for builtin base types, in the spirit of functools.singledispatch.
+_REGISTERED: Dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    Decimal: str,
+    Enum: _normalize_enum,
+    dict: _normalize_dict,
+    list: _normalize_list,
+    tuple: _normalize_list,
+    set: _normalize_list,
+}
+# Handlers keyed by concrete type; misses are resolved once and memoized.
+_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    cls: handler for cls, handler in _REGISTERED.items() if cls is not Enum
+}
+
+
+def _resolve_handler(value: Any) -> Callable[[Any], Any]:
+    cls = type(value)
+    # The first registered class in the MRO wins, so str/int-mixin enums stay scalars.
+    handler = next((_REGISTERED[base] for base in cls.__mro__ if base in _REGISTERED), None)
+    if handler is None:
+        if is_dataclass(cls):
+            handler = _normalize_dataclass
+        else:
+            extractor = _build_extractor(value)
+            handler = _identity if extractor is None else _object_handler(extractor)
+    _HANDLERS[cls] = handler
+    return handler
+
+
+def _normalize(value: Any) -> Any:
+    handler = _HANDLERS.get(type(value))
+    if handler is None:
+        handler = _resolve_handler(value)
+    return handler(value)
+
+
+def _is_plain_dict(value: Any) -> bool:
+    """Return True for a ``dict`` whose values are all builtin scalars."""
+
+    if type(value) is not dict:
+        return False
+    plain = _PLAIN_TYPES
+    return all(type(item) in plain for item in value.values())
+
+
+def _result(response: Any) -> Any:
     if response.errno != 0:
         raise RuntimeError(response.errmsg or "Opinion API error")
-    result = getattr(response, "result", None) or {}
-    payload = getattr(result, "list", None)
-    if payload is None:
-        payload = getattr(result, "data", None)
-    if payload is None and result:
-        payload = result
-    if payload is None:
+    try:
+        return response.result
+    except AttributeError:
+        return None
+
+
+def extract_list(response: Any) -> List[Dict[str, Any]]:
+    result = _result(response)
+    if not result:
         return []
-    normalized = _normalize(payload)
+    # SDK results expose ``list`` (paged endpoints) or ``data``; fall back to the result itself.
+    try:
+        payload = result.list
+    except AttributeError:
+        payload = None
+    if payload is None:
+        try:
+            payload = result.data
+        except AttributeError:
+            payload = None
+        if payload is None:
+            payload = result
+    payload_type = type(payload)
+    if payload_type is list:
+        if all(_is_plain_dict(item) for item in payload):
+            return payload
+        normalized = _normalize_list(payload)
+    elif payload_type is dict:
+        return [_normalize_dict(payload)]
+    else:
+        normalized = _normalize(payload)
     if isinstance(normalized, list):
         return [item if isinstance(item, dict) else {"value": item} for item in normalized]
     if isinstance(normalized, dict):
@@ -59,14 +169,20 @@ def extract_list(response: Any) -> List[Dict[str, Any]]:
 
 
 def extract_data(response: Any) -> Dict[str, Any]:
-    if response.errno != 0:
-        raise RuntimeError(response.errmsg or "Opinion API error")
-    result = getattr(response, "result", None) or {}
-    payload = getattr(result, "data", None)
-    if payload is None and result:
-        payload = result
-    if payload is None:
+    result = _result(response)
+    if not result:
         return {}
+    try:
+        payload = result.data
+    except AttributeError:
+        payload = None
+    if payload is None:
+        payload = result
+    payload_type = type(payload)
+    if payload_type is dict:
+        return payload if _is_plain_dict(payload) else _normalize_dict(payload)
+    if payload_type is list:
+        return {"items": _normalize_list(payload)}
     normalized = _normalize(payload)
     if isinstance(normalized, dict):
         return normalized
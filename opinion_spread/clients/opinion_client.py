@@ -12,9 +12,14 @@ from opinion_clob_sdk.chain.py_order_utils.model.order_type import LIMIT_ORDER
 from opinion_clob_sdk.chain.py_order_utils.model.sides import OrderSide
 
 from ..config.schema import APIConfig
+from ._pagination import iter_pages
 from ._response_utils import extract_data, extract_list, normalize
 
 
+_ACTIVATED_STATUS = 2
+_SIDE_MAP = {"buy": OrderSide.BUY, "sell": OrderSide.SELL}
+
+
 @dataclass
 class OrderPlacementResult:
     order_id: str
@@ -34,19 +39,14 @@ class OpinionClient:
             multi_sig_addr=api_config.multi_sig_addr,
         )
 
-    def fetch_active_markets(self, limit: int = 20) -> Iterable[Dict[str, Any]]:
-        page = 1
-        while True:
-            response = self._client.get_markets(page=page, limit=limit)
-            markets = extract_list(response)
-            if not markets:
-                break
-            for market in markets:
-                if market.get("status") == 2:  # ACTIVATED
-                    yield market
-            if len(markets) < limit:
-                break
-            page += 1
+    def fetch_active_markets(self, limit: int = 20, *, prefetch: int = 4) -> Iterable[Dict[str, Any]]:
+        get_markets = self._client.get_markets
+
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            return extract_list(get_markets(page=page, limit=limit))
+
+        for markets in iter_pages(fetch_page, limit=limit, window=prefetch):
+            yield from (market for market in markets if market.get("status") == _ACTIVATED_STATUS)
 
     def fetch_orderbook(self, token_id: str) -> Dict[str, Any]:
         response = self._client.get_orderbook(token_id=token_id)
@@ -87,7 +87,7 @@ class OpinionClient:
         if bool(amount_in_quote) == bool(amount_in_base):
             raise ValueError("Exactly one of amount_in_quote or amount_in_base must be provided")
 
-        side_enum = OrderSide.BUY if side.lower() == "buy" else OrderSide.SELL
+        side_enum = _SIDE_MAP.get(side.lower(), OrderSide.SELL)
 
         order = PlaceOrderDataInput(
             marketId=market_id,
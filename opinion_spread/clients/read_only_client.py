@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
     from opinion_clob_sdk import Client as OpinionSDKClient
@@ -14,7 +15,9 @@ except ImportError:  # pragma: no cover - handled for test environments without
 
 _DEFAULT_PRIVATE_KEY = "0x" + "0" * 64
 _DEFAULT_MULTISIG = "0x0000000000000000000000000000000000000000"
+_MARKETS_TTL = 5.0  # seconds a fetched market page is reused by iter_all_markets
 
+from ._pagination import iter_pages  # noqa: E402
 from ._response_utils import extract_data, extract_list, normalize  # noqa: E402
 
 
@@ -45,22 +48,41 @@ class OpinionReadOnlyClient:
             private_key=config.private_key or _DEFAULT_PRIVATE_KEY,
             multi_sig_addr=config.multi_sig_addr or _DEFAULT_MULTISIG,
         )
+        self._markets_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
 
     def get_markets(self, **kwargs: Any) -> List[Dict[str, Any]]:
         return extract_list(self._client.get_markets(**kwargs))
 
-    def iter_all_markets(self, *, page_size: int = 20, **kwargs: Any) -> Iterable[Dict[str, Any]]:
-        page = 1
-        while True:
-            response = self._client.get_markets(page=page, limit=page_size, **kwargs)
-            markets = extract_list(response)
-            if not markets:
-                break
-            for market in markets:
-                yield market
-            if len(markets) < page_size:
-                break
-            page += 1
+    def _get_markets_page(self, page: int, limit: int, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch one market page, reusing a copy fetched less than ``_MARKETS_TTL`` ago.
+
+        Callers always get fresh list and row dicts, so mutating them cannot leak into the cache.
+        """
+
+        cache = self._markets_cache
+        key = (page, limit, tuple(sorted(filters.items())))
+        try:
+            cached = cache.get(key)
+        except TypeError:  # unhashable filter values are never cached
+            return extract_list(self._client.get_markets(page=page, limit=limit, **filters))
+        now = time.monotonic()
+        if cached is None or now - cached[0] >= _MARKETS_TTL:
+            markets = extract_list(self._client.get_markets(page=page, limit=limit, **filters))
+            # Snapshot items() first: pages are fetched from several threads at once.
+            for stale_key, (fetched_at, _) in list(cache.items()):
+                if now - fetched_at >= _MARKETS_TTL:
+                    cache.pop(stale_key, None)
+            cached = cache[key] = (now, markets)
+        return [dict(market) for market in cached[1]]
+
+    def iter_all_markets(
+        self, *, page_size: int = 20, prefetch: int = 4, **kwargs: Any
+    ) -> Iterable[Dict[str, Any]]:
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            return self._get_markets_page(page, page_size, kwargs)
+
+        for markets in iter_pages(fetch_page, limit=page_size, window=prefetch):
+            yield from markets
 
     def get_market(self, market_id: int, *, use_cache: bool = True) -> Dict[str, Any]:
         return extract_data(self._client.get_market(market_id=market_id, use_cache=use_cache))
@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .schema import APIConfig, Config, LoggingConfig, MonitoringConfig, RiskConfig, SchedulerConfig, StrategyConfig
 
@@ -17,6 +15,8 @@ ENV_PREFIX = "OPINION_SPREAD"
 def _load_yaml_config(path: Optional[Path]) -> Dict[str, Any]:
     if path is None:
         return {}
+    import yaml  # deferred: env-only configurations never need PyYAML
+
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
     with path.open("r", encoding="utf-8") as fp:
@@ -30,66 +30,79 @@ def _env_key(section: str, field: str) -> str:
     return f"{ENV_PREFIX}_{section}_{field}".upper()
 
 
-def _apply_env_overrides(config_dict: Dict[str, Any]) -> Dict[str, Any]:
-    overrides: Dict[str, Any] = {}
+def _parse_bool(value: str) -> bool:
+    return value.lower() in {"1", "true", "yes"}
 
-    def set_override(section: str, field: str, cast=str):
-        env_name = _env_key(section, field)
-        value = os.getenv(env_name)
-        if value is None:
-            return
-        try:
-            overrides.setdefault(section, {})[field] = cast(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid value for environment variable {env_name}: {value}") from exc
 
+_ENV_FIELDS: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
     # API credentials
-    for key in ("host", "api_key", "rpc_url", "private_key", "multi_sig_addr"):
-        set_override("api", key)
-    set_override("api", "chain_id", int)
-
+    ("api", "host", str),
+    ("api", "api_key", str),
+    ("api", "rpc_url", str),
+    ("api", "private_key", str),
+    ("api", "multi_sig_addr", str),
+    ("api", "chain_id", int),
     # Strategy
-    set_override("strategy", "top_n_tokens", int)
-    set_override("strategy", "min_liquidity", float)
-    set_override("strategy", "max_spread", float)
-    set_override("strategy", "min_price", float)
-    set_override("strategy", "max_price", float)
-
+    ("strategy", "top_n_tokens", int),
+    ("strategy", "min_liquidity", float),
+    ("strategy", "max_spread", float),
+    ("strategy", "min_price", float),
+    ("strategy", "max_price", float),
+    ("strategy", "orderbook_concurrency", int),
     # Risk
-    set_override("risk", "max_total_position", float)
-    set_override("risk", "max_position_per_market", float)
-    set_override("risk", "min_available_balance", float)
-    set_override("risk", "duplicate_order_cooldown", int)
-    set_override("risk", "sell_order_threshold", float)
-
+    ("risk", "max_total_position", float),
+    ("risk", "max_position_per_market", float),
+    ("risk", "min_available_balance", float),
+    ("risk", "duplicate_order_cooldown", int),
+    ("risk", "sell_order_threshold", float),
     # Scheduler
-    set_override("scheduler", "poll_interval_seconds", float)
-    set_override("scheduler", "order_refresh_interval", float)
-
+    ("scheduler", "poll_interval_seconds", float),
+    ("scheduler", "order_refresh_interval", float),
     # Logging
-    set_override("logging", "level")
-    set_override("logging", "log_to_console", lambda v: v.lower() in {"1", "true", "yes"})
-    set_override("logging", "log_to_file", lambda v: v.lower() in {"1", "true", "yes"})
-    set_override("logging", "log_file")
-    set_override("logging", "json_format", lambda v: v.lower() in {"1", "true", "yes"})
-
+    ("logging", "level", str),
+    ("logging", "log_to_console", _parse_bool),
+    ("logging", "log_to_file", _parse_bool),
+    ("logging", "log_file", str),
+    ("logging", "json_format", _parse_bool),
     # Monitoring
-    set_override("monitoring", "enable_metrics", lambda v: v.lower() in {"1", "true", "yes"})
-    set_override("monitoring", "metrics_backend")
+    ("monitoring", "enable_metrics", _parse_bool),
+    ("monitoring", "metrics_backend", str),
+)
 
-    value = os.getenv(f"{ENV_PREFIX}_ENABLED_MARKETS")
+_ENV_KEYS: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = tuple(
+    (section, field, _env_key(section, field), cast) for section, field, cast in _ENV_FIELDS
+)
+
+
+def _apply_env_overrides(config_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge environment overrides into ``config_dict`` in place and return it."""
+
+    overrides: Dict[str, Any] = {}
+
+    env = os.environ
+    for section, field, env_name, cast in _ENV_KEYS:
+        value = env.get(env_name)
+        if value is None:
+            continue
+        try:
+            overrides.setdefault(section, {})[field] = cast(value)
+        except ValueError as exc:
+            raise ValueError(f"Invalid value for environment variable {env_name}: {value}") from exc
+
+    value = env.get(f"{ENV_PREFIX}_ENABLED_MARKETS")
     if value:
         overrides["enabled_markets"] = [int(i.strip()) for i in value.split(",") if i.strip()]
 
-    def merge(d: Dict[str, Any], o: Dict[str, Any]) -> Dict[str, Any]:
-        for key, value in o.items():
-            if isinstance(value, dict):
-                d[key] = merge(d.get(key, {}), value)
-            else:
-                d[key] = value
-        return d
-
-    return merge(config_dict.copy(), overrides)
+    # Overrides are always section -> field, so a one-level merge is enough.
+    for section, fields in overrides.items():
+        if isinstance(fields, dict):
+            target = config_dict.get(section)
+            if not isinstance(target, dict):
+                target = config_dict[section] = {}
+            target.update(fields)
+        else:
+            config_dict[section] = fields
+    return config_dict
 
 
 def _build_config(data: Dict[str, Any]) -> Config:
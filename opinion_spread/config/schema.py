@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from decimal import Decimal
 from typing import List, Optional
 
 
@@ -28,6 +29,12 @@ class StrategyConfig:
     min_price: float = 0.05
     max_price: float = 0.95
     order_quote_amount: float = 20.0
+    orderbook_concurrency: int = 16
+    quote_amount_decimal: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Parsed once here so candidate building does not re-convert it every cycle.
+        object.__setattr__(self, "quote_amount_decimal", Decimal(str(self.order_quote_amount)))
 
 
 @dataclass(frozen=True)
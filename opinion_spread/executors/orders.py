@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..clients.opinion_client import OpinionClient
 from ..config.schema import RiskConfig, StrategyConfig
 from ..logging_utils.logger import get_logger, log_with_context
-from ..models.core import AccountState, OpenOrder, OrderCandidate
+from ..models.core import AccountState, OrderCandidate, Position
 from ..risk.checks import RiskDecision, RiskManager, RiskViolation
-from ..utils.decimal_utils import format_decimal
+from ..utils.decimal_utils import ZERO, format_decimal
 
 
 class OrderExecutor:
@@ -19,38 +20,42 @@ class OrderExecutor:
         self._strategy_config = strategy_config
         self._risk_manager = risk_manager
         self._logger = get_logger()
+        self._log_enabled = self._logger.isEnabledFor
 
     def submit_buy_order(self, candidate: OrderCandidate) -> bool:
         try:
             decision = self._risk_manager.evaluate(candidate)
         except RiskViolation as exc:
+            if self._log_enabled(20):
+                log_with_context(
+                    self._logger,
+                    level=20,
+                    message="Risk violation for buy order",
+                    reason=str(exc),
+                    market_id=candidate.market_id,
+                    token_id=candidate.token_id,
+                )
+            return False
+
+        price_str = str(candidate.price)
+        quote_amount_str = format_decimal(candidate.quote_amount)
+        if self._log_enabled(20):
             log_with_context(
                 self._logger,
                 level=20,
-                message="Risk violation for buy order",
-                reason=str(exc),
+                message="Submitting buy limit order",
                 market_id=candidate.market_id,
                 token_id=candidate.token_id,
+                price=price_str,
+                quote_amount=quote_amount_str,
             )
-            return False
-
-        quote_amount_str = format_decimal(candidate.quote_amount)
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Submitting buy limit order",
-            market_id=candidate.market_id,
-            token_id=candidate.token_id,
-            price=str(candidate.price),
-            quote_amount=quote_amount_str,
-        )
 
         try:
             result = self._client.place_limit_order(
                 market_id=candidate.market_id,
                 token_id=candidate.token_id,
                 side="buy",
-                price=str(candidate.price),
+                price=price_str,
                 amount_in_quote=quote_amount_str,
             )
         except Exception as exc:  # noqa: BLE001
@@ -65,47 +70,51 @@ class OrderExecutor:
             return False
 
         self._risk_manager.commit(decision)
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Buy order placed",
-            market_id=candidate.market_id,
-            token_id=candidate.token_id,
-            order_id=result.order_id,
-        )
+        if self._log_enabled(20):
+            log_with_context(
+                self._logger,
+                level=20,
+                message="Buy order placed",
+                market_id=candidate.market_id,
+                token_id=candidate.token_id,
+                order_id=result.order_id,
+            )
         return True
 
     def submit_sell_order(self, candidate: OrderCandidate) -> bool:
         try:
             decision = self._risk_manager.evaluate(candidate)
         except RiskViolation as exc:
+            if self._log_enabled(20):
+                log_with_context(
+                    self._logger,
+                    level=20,
+                    message="Risk violation for sell order",
+                    reason=str(exc),
+                    market_id=candidate.market_id,
+                    token_id=candidate.token_id,
+                )
+            return False
+
+        price_str = str(candidate.price)
+        base_amount_str = format_decimal(candidate.base_amount)
+        if self._log_enabled(20):
             log_with_context(
                 self._logger,
                 level=20,
-                message="Risk violation for sell order",
-                reason=str(exc),
+                message="Submitting sell limit order",
                 market_id=candidate.market_id,
                 token_id=candidate.token_id,
+                price=price_str,
+                quote_amount=format_decimal(candidate.quote_amount),
             )
-            return False
-
-        quote_amount_str = format_decimal(candidate.quote_amount)
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Submitting sell limit order",
-            market_id=candidate.market_id,
-            token_id=candidate.token_id,
-            price=str(candidate.price),
-            quote_amount=quote_amount_str,
-        )
         try:
             result = self._client.place_limit_order(
                 market_id=candidate.market_id,
                 token_id=candidate.token_id,
                 side="sell",
-                price=str(candidate.price),
-                amount_in_base=format_decimal(candidate.base_amount),
+                price=price_str,
+                amount_in_base=base_amount_str,
             )
         except Exception as exc:  # noqa: BLE001
             log_with_context(
@@ -119,23 +128,56 @@ class OrderExecutor:
             return False
 
         self._risk_manager.commit(decision)
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Sell order placed",
-            market_id=candidate.market_id,
-            token_id=candidate.token_id,
-            order_id=result.order_id,
-        )
+        if self._log_enabled(20):
+            log_with_context(
+                self._logger,
+                level=20,
+                message="Sell order placed",
+                market_id=candidate.market_id,
+                token_id=candidate.token_id,
+                order_id=result.order_id,
+            )
         return True
 
 
 class SellOrderManager:
-    def __init__(self, client: OpinionClient, risk_manager: RiskManager, risk_config: RiskConfig):
+    def __init__(
+        self,
+        client: OpinionClient,
+        risk_manager: RiskManager,
+        risk_config: RiskConfig,
+        orderbook_concurrency: int = StrategyConfig.orderbook_concurrency,
+    ):
         self._client = client
         self._risk_manager = risk_manager
         self._risk_config = risk_config
+        self._orderbook_concurrency = orderbook_concurrency
+        self._sell_threshold = Decimal(str(risk_config.sell_order_threshold))
         self._logger = get_logger()
+        self._log_enabled = self._logger.isEnabledFor
+
+    def _fetch_orderbook(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one orderbook, returning None on failure so other tokens can still be sold."""
+
+        try:
+            return self._client.fetch_orderbook(token_id)
+        except Exception as exc:  # noqa: BLE001
+            log_with_context(
+                self._logger,
+                level=40,
+                message="Failed to fetch orderbook for auto sell",
+                error=str(exc),
+                token_id=token_id,
+            )
+            return None
+
+    def _fetch_orderbooks(self, token_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        token_ids = list(dict.fromkeys(token_ids))
+        workers = min(self._orderbook_concurrency, len(token_ids))
+        if workers <= 1:
+            return {token_id: self._fetch_orderbook(token_id) for token_id in token_ids}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(token_ids, executor.map(self._fetch_orderbook, token_ids)))
 
     def manage(self, account: AccountState) -> Dict[str, float]:
         summary: Dict[str, float] = {
@@ -145,59 +187,63 @@ class SellOrderManager:
             "sell_orders_success": 0.0,
         }
 
-        grouped_orders: dict[int, List[OpenOrder]] = {}
+        sell_totals: Dict[int, Decimal] = {}
         for order in account.open_orders:
-            if order.side.lower() != "sell":
+            if order.side != "sell":
                 continue
-            grouped_orders.setdefault(order.market_id, []).append(order)
+            sell_totals[order.market_id] = sell_totals.get(order.market_id, ZERO) + order.remaining
 
+        threshold = self._sell_threshold
+        pending: List[Tuple[Position, Decimal]] = []
         for position in account.positions:
-            existing_sell_orders = grouped_orders.get(position.market_id, [])
-            total_sell_size = sum(order.remaining for order in existing_sell_orders)
-            diff = position.shares - total_sell_size
-            if diff <= Decimal(str(self._risk_config.sell_order_threshold)):
+            diff = position.shares - sell_totals.get(position.market_id, ZERO)
+            if diff <= threshold:
                 continue
+            pending.append((position, diff))
+
+        orderbooks = self._fetch_orderbooks(position.token_id for position, _ in pending)
 
+        for position, diff in pending:
             summary["sell_orders_considered"] += 1.0
+            orderbook = orderbooks[position.token_id]
+            # A failed fetch (None) counts as a failed sell, same as an empty ask side.
+            asks = orderbook.get("asks", []) if orderbook is not None else []
+            if not asks:
+                summary["sell_orders_failed"] += 1.0
+                continue
+            best_ask = asks[0]
+            price = Decimal(str(best_ask.get("price", "0")))
             candidate = OrderCandidate(
                 market_id=position.market_id,
                 token_id=position.token_id,
                 side="sell",
-                price=Decimal("0"),
-                quote_amount=Decimal("0"),
+                price=price,
+                quote_amount=price * diff,
                 base_amount=diff,
             )
-            orderbook = self._client.fetch_orderbook(position.token_id)
-            asks = orderbook.get("asks", [])
-            if not asks:
-                summary["sell_orders_failed"] += 1.0
-                continue
-            best_ask = asks[0]
-            price = Decimal(str(best_ask.get("price", "0")))
-            candidate.price = price
-            candidate.quote_amount = price * diff
-            candidate.base_amount = diff
             try:
                 decision = self._risk_manager.evaluate(candidate)
             except RiskViolation as exc:
-                log_with_context(
-                    self._logger,
-                    level=20,
-                    message="Sell order blocked by risk manager",
-                    reason=str(exc),
-                    market_id=position.market_id,
-                    token_id=position.token_id,
-                )
+                if self._log_enabled(20):
+                    log_with_context(
+                        self._logger,
+                        level=20,
+                        message="Sell order blocked by risk manager",
+                        reason=str(exc),
+                        market_id=position.market_id,
+                        token_id=position.token_id,
+                    )
                 summary["sell_orders_blocked"] += 1.0
                 continue
 
+            size_str = format_decimal(diff)
             try:
                 result = self._client.place_limit_order(
                     market_id=position.market_id,
                     token_id=position.token_id,
                     side="sell",
                     price=str(price),
-                    amount_in_base=format_decimal(diff),
+                    amount_in_base=size_str,
                 )
             except Exception as exc:  # noqa: BLE001
                 log_with_context(
@@ -212,15 +258,16 @@ class SellOrderManager:
                 continue
 
             self._risk_manager.commit(decision)
-            log_with_context(
-                self._logger,
-                level=20,
-                message="Auto sell order placed",
-                market_id=position.market_id,
-                token_id=position.token_id,
-                order_id=result.order_id,
-                size=format_decimal(diff),
-            )
+            if self._log_enabled(20):
+                log_with_context(
+                    self._logger,
+                    level=20,
+                    message="Auto sell order placed",
+                    market_id=position.market_id,
+                    token_id=position.token_id,
+                    order_id=result.order_id,
+                    size=size_str,
+                )
             summary["sell_orders_success"] += 1.0
 
         return summary
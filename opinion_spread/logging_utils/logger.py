@@ -5,12 +5,29 @@ from __future__ import annotations
 import json
 import logging
 from logging import Logger
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None  # type: ignore[assignment]
 
 from ..config.schema import LoggingConfig
 
 
 _LOGGER_NAME = "opinion_spread"
+_EXC_FORMATTER = logging.Formatter()
+
+
+def _stdlib_dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _orjson_dumps(payload: Dict[str, Any]) -> str:
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+_dumps: Callable[[Dict[str, Any]], str] = _stdlib_dumps if orjson is None else _orjson_dumps
 
 
 def _json_formatter(record: logging.LogRecord) -> str:
@@ -23,10 +40,10 @@ def _json_formatter(record: logging.LogRecord) -> str:
         "line": record.lineno,
     }
     if record.exc_info:
-        payload["exc_info"] = logging.Formatter().formatException(record.exc_info)
+        payload["exc_info"] = _EXC_FORMATTER.formatException(record.exc_info)
     if hasattr(record, "extra_data") and isinstance(record.extra_data, dict):
         payload.update(record.extra_data)
-    return json.dumps(payload, ensure_ascii=False)
+    return _dumps(payload)
 
 
 class JsonFormatter(logging.Formatter):
@@ -77,5 +94,7 @@ def get_logger() -> Logger:
 
 
 def log_with_context(logger: Logger, level: int, message: str, **context: Any) -> None:
+    if not logger.isEnabledFor(level):
+        return
     logger.log(level, message, extra={"extra_data": context} if context else None)
 
@@ -3,12 +3,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
+
+# Field-only models declare __slots__ by hand; dataclass(slots=True) needs Python 3.10.
+
+
+class FrozenSlotsMixin:
+    """Copy/pickle support for frozen dataclasses with hand-written ``__slots__``.
+
+    The default slot-state restore goes through the frozen ``__setattr__``; this
+    mirrors the ``__getstate__``/``__setstate__`` that ``dataclass(slots=True)`` adds.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 @dataclass
 class Market:
+    __slots__ = ("market_id", "title", "status", "yes_token", "no_token", "volume", "quote_token")
+
     market_id: int
     title: str
     status: int
@@ -20,12 +42,16 @@ class Market:
 
 @dataclass
 class OrderbookLevel:
+    __slots__ = ("price", "size")
+
     price: Decimal
     size: Decimal
 
 
 @dataclass
 class OrderbookSnapshot:
+    __slots__ = ("token_id", "bids", "asks")
+
     token_id: str
     bids: List[OrderbookLevel]
     asks: List[OrderbookLevel]
@@ -37,8 +63,10 @@ class OrderbookSnapshot:
         return self.asks[0] if self.asks else None
 
 
-@dataclass
-class TokenMetrics:
+@dataclass(frozen=True)
+class TokenMetrics(FrozenSlotsMixin):
+    __slots__ = ("token_id", "market_id", "side", "best_bid", "best_ask", "spread", "liquidity_score")
+
     token_id: str
     market_id: int
     side: str  # "yes" or "no"
@@ -48,8 +76,10 @@ class TokenMetrics:
     liquidity_score: Decimal
 
 
-@dataclass
-class Position:
+@dataclass(frozen=True)
+class Position(FrozenSlotsMixin):
+    __slots__ = ("market_id", "token_id", "outcome_side", "shares", "average_price")
+
     market_id: int
     token_id: str
     outcome_side: str
@@ -57,8 +87,10 @@ class Position:
     average_price: Optional[Decimal]
 
 
-@dataclass
-class OpenOrder:
+@dataclass(frozen=True)
+class OpenOrder(FrozenSlotsMixin):
+    __slots__ = ("order_id", "market_id", "token_id", "side", "price", "remaining")
+
     order_id: str
     market_id: int
     token_id: str
@@ -66,20 +98,41 @@ class OpenOrder:
     price: Decimal
     remaining: Decimal
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "side", self.side.lower())
 
-@dataclass
+
+# Not slotted: cached_property stores its values in the instance __dict__.
+@dataclass(frozen=True)
 class AccountState:
     total_balances: Dict[str, Decimal]
     available_balances: Dict[str, Decimal]
     positions: List[Position]
     open_orders: List[OpenOrder]
 
+    @cached_property
+    def open_buy_token_ids(self) -> FrozenSet[str]:
+        """Tokens with at least one open buy order, computed once per snapshot."""
+
+        return frozenset([order.token_id for order in self.open_orders if order.side == "buy"])
+
+    @cached_property
+    def positions_tokens(self) -> FrozenSet[str]:
+        """Tokens with a non-zero position, computed once per snapshot."""
+
+        return frozenset([position.token_id for position in self.positions if position.shares > 0])
+
+
+@dataclass(frozen=True)
+class OrderCandidate(FrozenSlotsMixin):
+    __slots__ = ("market_id", "token_id", "side", "price", "quote_amount", "base_amount")
 
-@dataclass
-class OrderCandidate:
     market_id: int
     token_id: str
     side: str
     price: Decimal
     quote_amount: Decimal
     base_amount: Decimal
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "side", self.side.lower())
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Dict
 
 
 @dataclass
 class MetricsRecorder:
-    counters: Dict[str, float] = field(default_factory=dict)
+    counters: Counter = field(default_factory=Counter)
     last_cycle_duration: float = 0.0
 
     def increment(self, name: str, value: float = 1.0) -> None:
-        self.counters[name] = self.counters.get(name, 0.0) + value
+        self.counters[name] += value
 
     def observe_cycle_duration(self, duration: float) -> None:
         self.last_cycle_duration = duration
@@ -24,6 +25,4 @@ class MetricsRecorder:
         return data
 
     def merge_counts(self, **counts: float) -> None:
-        for key, value in counts.items():
-            if value:
-                self.increment(key, value)
+        self.counters.update({key: value for key, value in counts.items() if value})
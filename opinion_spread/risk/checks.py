@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from ..config.schema import RiskConfig
-from ..models.core import AccountState, OrderCandidate
+from ..models.core import AccountState, FrozenSlotsMixin, OrderCandidate
+from ..utils.decimal_utils import ZERO
+
+
+# (market_id, token_id, side, price) identifying repeated submissions of the same order.
+DuplicateKey = Tuple[int, str, str, Decimal]
+
+_MAX_TRACKED_ORDERS = 10_000
 
 
 class RiskViolation(Exception):
@@ -17,33 +23,51 @@ class RiskViolation(Exception):
 
 
 @dataclass(frozen=True)
-class RiskDecision:
+class RiskDecision(FrozenSlotsMixin):
+    __slots__ = ("candidate", "available_quote", "total_position", "market_position", "duplicate_key", "timestamp")
+
     candidate: OrderCandidate
     available_quote: Decimal
     total_position: Decimal
     market_position: Decimal
-    duplicate_key: str
+    duplicate_key: DuplicateKey
     timestamp: datetime
 
 
 class RiskManager:
     def __init__(self, config: RiskConfig):
         self._config = config
-        self._last_order_times: Dict[str, datetime] = {}
-        self._available_quote: Decimal = Decimal("0")
-        self._total_position: Decimal = Decimal("0")
-        self._position_by_market: Dict[int, Decimal] = defaultdict(Decimal)
+        self._cooldown = timedelta(seconds=config.duplicate_order_cooldown)
+        self._min_available = Decimal(str(config.min_available_balance))
+        self._max_total = Decimal(str(config.max_total_position))
+        self._max_market = Decimal(str(config.max_position_per_market))
+        self._last_order_times: Dict[DuplicateKey, datetime] = {}
+        self._available_quote: Decimal = ZERO
+        self._total_position: Decimal = ZERO
+        self._position_by_market: Dict[int, Decimal] = {}
         self._account_snapshot: Optional[AccountState] = None
 
     def reset(self, account_state: AccountState) -> None:
         """Reset per-iteration aggregates based on the latest account snapshot."""
 
         self._account_snapshot = account_state
-        self._available_quote = account_state.available_balances.get("USDT", Decimal("0"))
-        self._total_position = sum(position.shares for position in account_state.positions)
-        self._position_by_market = defaultdict(Decimal)
+        self._available_quote = account_state.available_balances.get("USDT", ZERO)
+        total_position = ZERO
+        # Refill the existing dict in place; market ids are mostly stable between cycles.
+        position_by_market = self._position_by_market
+        position_by_market.clear()
         for position in account_state.positions:
-            self._position_by_market[position.market_id] += position.shares
+            shares = position.shares
+            market_id = position.market_id
+            total_position += shares
+            position_by_market[market_id] = position_by_market.get(market_id, ZERO) + shares
+        self._total_position = total_position
+
+    @property
+    def total_position(self) -> Decimal:
+        """Total shares held as of the last reset, adjusted by committed orders."""
+
+        return self._total_position
 
     def _ensure_initialized(self) -> None:
         if self._account_snapshot is None:
@@ -52,22 +76,17 @@ class RiskManager:
     def evaluate(self, candidate: OrderCandidate) -> RiskDecision:
         self._ensure_initialized()
 
-        cooldown = timedelta(seconds=self._config.duplicate_order_cooldown)
-        duplicate_key = f"{candidate.market_id}:{candidate.token_id}:{candidate.side}:{candidate.price}".lower()
+        side = candidate.side
+        duplicate_key = (candidate.market_id, candidate.token_id, side, candidate.price)
         now = datetime.utcnow()
         last_time = self._last_order_times.get(duplicate_key)
-        if last_time and now - last_time < cooldown:
+        if last_time and now - last_time < self._cooldown:
             raise RiskViolation("Duplicate order detected within cooldown window")
 
         available_quote = self._available_quote
         total_position = self._total_position
-        market_position = self._position_by_market.get(candidate.market_id, Decimal("0"))
-
-        min_available = Decimal(str(self._config.min_available_balance))
-        max_total = Decimal(str(self._config.max_total_position))
-        max_market = Decimal(str(self._config.max_position_per_market))
+        market_position = self._position_by_market.get(candidate.market_id, ZERO)
 
-        side = candidate.side.lower()
         if side == "buy":
             quote_amount = candidate.quote_amount
             if quote_amount <= 0:
@@ -75,17 +94,17 @@ class RiskManager:
             if quote_amount > available_quote:
                 raise RiskViolation("Quote amount exceeds available balance")
             remaining = available_quote - quote_amount
-            if remaining < min_available:
+            if remaining < self._min_available:
                 raise RiskViolation("Insufficient available balance after order")
             available_quote = remaining
 
             projected_total = total_position + candidate.base_amount
-            if projected_total > max_total:
+            if projected_total > self._max_total:
                 raise RiskViolation("Total position limit exceeded")
             total_position = projected_total
 
             projected_market = market_position + candidate.base_amount
-            if projected_market > max_market:
+            if projected_market > self._max_market:
                 raise RiskViolation("Market position limit exceeded")
             market_position = projected_market
 
@@ -117,4 +136,18 @@ class RiskManager:
             self._position_by_market.pop(decision.candidate.market_id, None)
         else:
             self._position_by_market[decision.candidate.market_id] = decision.market_position
-        self._last_order_times[decision.duplicate_key] = decision.timestamp
+        last_order_times = self._last_order_times
+        # Re-insert so the dict stays ordered from oldest to newest submission.
+        last_order_times.pop(decision.duplicate_key, None)
+        last_order_times[decision.duplicate_key] = decision.timestamp
+        self._prune_order_times(decision.timestamp)
+
+    def _prune_order_times(self, now: datetime) -> None:
+        """Drop entries that can no longer block an order, oldest first."""
+
+        last_order_times = self._last_order_times
+        while last_order_times:
+            oldest_key = next(iter(last_order_times))
+            if len(last_order_times) <= _MAX_TRACKED_ORDERS and now - last_order_times[oldest_key] < self._cooldown:
+                break
+            del last_order_times[oldest_key]
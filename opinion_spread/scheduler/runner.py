@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from decimal import Decimal
 from typing import Dict
 
 from ..clients.opinion_client import OpinionClient
@@ -37,9 +36,13 @@ class TradingScheduler:
     def __init__(self, context: TradingContext):
         self._context = context
         self._logger = get_logger()
+        self._log_enabled = self._logger.isEnabledFor
 
     def _log_account_snapshot(self, label: str, account_state: AccountState) -> None:
-        total_positions_shares = sum((position.shares for position in account_state.positions), Decimal("0"))
+        if not self._log_enabled(20):
+            return
+        # Called right after risk_manager.reset(), which already summed the position shares.
+        total_positions_shares = self._context.risk_manager.total_position
         available_balances = {token: str(balance) for token, balance in account_state.available_balances.items()}
         log_with_context(
             self._logger,
@@ -53,6 +56,8 @@ class TradingScheduler:
         )
 
     def _summarize_state(self, cycle_index: int) -> None:
+        if not self._log_enabled(20):
+            return
         metrics_snapshot = self._context.metrics.snapshot()
         log_with_context(
             self._logger,
@@ -67,12 +72,13 @@ class TradingScheduler:
         top_metrics = self._context.analyzer.select_top_tokens(markets)
         candidates = self._context.candidate_builder.build_buy_candidates(top_metrics, account_state)
 
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Buy candidates prepared",
-            count=len(candidates),
-        )
+        if self._log_enabled(20):
+            log_with_context(
+                self._logger,
+                level=20,
+                message="Buy candidates prepared",
+                count=len(candidates),
+            )
 
         success = 0
         failures = 0
@@ -82,14 +88,15 @@ class TradingScheduler:
             else:
                 failures += 1
 
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Buy execution summary",
-            attempted=len(candidates),
-            success=success,
-            failed=failures,
-        )
+        if self._log_enabled(20):
+            log_with_context(
+                self._logger,
+                level=20,
+                message="Buy execution summary",
+                attempted=len(candidates),
+                success=success,
+                failed=failures,
+            )
 
         return {
             "buy_markets_considered": float(len(top_metrics)),
@@ -101,27 +108,26 @@ class TradingScheduler:
     def _manage_sell_orders(self, account_state: AccountState) -> Dict[str, float]:
         self._context.risk_manager.reset(account_state)
         summary = self._context.sell_manager.manage(account_state)
-        log_with_context(
-            self._logger,
-            level=20,
-            message="Sell management summary",
-            summary=summary,
-        )
+        if self._log_enabled(20):
+            log_with_context(
+                self._logger,
+                level=20,
+                message="Sell management summary",
+                summary=summary,
+            )
         return summary
 
     def run(self) -> None:
         poll_interval = self._context.config.scheduler.poll_interval_seconds
         cycle_index = 0
 
-        account_state = self._context.account_manager.refresh()
-        self._context.risk_manager.reset(account_state)
-        self._log_account_snapshot("startup", account_state)
-
+        next_tick = time.monotonic()
         while True:
             cycle_index += 1
             start_time = time.monotonic()
 
             try:
+                account_state = self._context.account_manager.refresh()
                 self._context.risk_manager.reset(account_state)
                 self._log_account_snapshot(f"cycle_{cycle_index}_start", account_state)
 
@@ -139,8 +145,14 @@ class TradingScheduler:
                 self._context.metrics.observe_cycle_duration(duration)
                 self._summarize_state(cycle_index)
 
-            account_state = self._context.account_manager.refresh()
-            time.sleep(poll_interval)
+            # Sleep until the next scheduled tick so cycle work does not push the cadence back.
+            next_tick += poll_interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                self._context.metrics.increment("cycle_overruns")
+                next_tick = time.monotonic()
 
 
 def build_context(config_path: str | None = None) -> TradingContext:
@@ -154,7 +166,7 @@ def build_context(config_path: str | None = None) -> TradingContext:
     candidate_builder = CandidateBuilder(config.strategy)
     risk_manager = RiskManager(config.risk)
     executor = OrderExecutor(client, config.strategy, risk_manager)
-    sell_manager = SellOrderManager(client, risk_manager, config.risk)
+    sell_manager = SellOrderManager(client, risk_manager, config.risk, config.strategy.orderbook_concurrency)
     metrics = MetricsRecorder()
 
     return TradingContext(
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from dotenv import load_dotenv
 
@@ -11,6 +13,9 @@ from opinion_spread.clients._response_utils import normalize
 from opinion_spread.clients.read_only_client import OpinionReadOnlyClient, ReadOnlyConfig
 
 
+_BATCH_SIZE = 64
+
+
 def _build_token_snapshot(client: OpinionReadOnlyClient, token_id: Optional[str]) -> Optional[Dict[str, Any]]:
     if not token_id:
         return None
@@ -25,21 +30,94 @@ def _build_token_snapshot(client: OpinionReadOnlyClient, token_id: Optional[str]
     }
 
 
-def _dump_raw_orderbook(client: OpinionReadOnlyClient, token_id: str, label: str) -> None:
+def _dump_raw_orderbook(client: OpinionReadOnlyClient, token_id: str, label: str) -> List[str]:
     try:
         response = client._client.get_orderbook(token_id=token_id)  # type: ignore[attr-defined]
     except Exception as exc:  # pragma: no cover
-        print(f"    [raw] Failed to fetch raw orderbook for {label}: {exc}")
-        return
+        return [f"    [raw] Failed to fetch raw orderbook for {label}: {exc}"]
     raw_payload = getattr(getattr(response, "result", None), "data", None)
     normalized = normalize(raw_payload)
-    print(f"    [raw] Payload type: {type(raw_payload)}")
-    print(f"    [raw] Normalized keys: {list(normalized.keys()) if isinstance(normalized, dict) else type(normalized)}")
+    lines = [
+        f"    [raw] Payload type: {type(raw_payload)}",
+        f"    [raw] Normalized keys: {list(normalized.keys()) if isinstance(normalized, dict) else type(normalized)}",
+    ]
     if isinstance(normalized, dict):
         bids = normalized.get("bids")
         asks = normalized.get("asks")
-        print(f"    [raw] bids sample: {bids[:3] if isinstance(bids, list) else bids}")
-        print(f"    [raw] asks sample: {asks[:3] if isinstance(asks, list) else asks}")
+        lines.append(f"    [raw] bids sample: {bids[:3] if isinstance(bids, list) else bids}")
+        lines.append(f"    [raw] asks sample: {asks[:3] if isinstance(asks, list) else asks}")
+    return lines
+
+
+def _process_market(
+    client: OpinionReadOnlyClient,
+    market: Dict[str, Any],
+    *,
+    has_detail: bool,
+    show_raw_market: bool,
+) -> str:
+    """Fetch everything shown for one market and return its report as a single block."""
+
+    market_id = market.get("market_id")
+    title = market.get("market_title")
+    detail = market if has_detail else client.get_market(int(market_id))
+    raw_market_response = None
+    if show_raw_market:
+        raw_market_response = normalize(client.get_market_raw(int(market_id)))
+
+    detail_normalized = normalize(detail)
+    volume = detail_normalized.get("volume")
+    liquidity = detail_normalized.get("liquidity")
+    volume24h = detail_normalized.get("volume24h") or detail_normalized.get("vol24h")
+    fee_rate = detail_normalized.get("feeRate")
+    yes_label = detail_normalized.get("yesLabel") or detail_normalized.get("yes_label")
+    no_label = detail_normalized.get("noLabel") or detail_normalized.get("no_label")
+    quote_token = detail_normalized.get("quoteToken")
+    market_type = detail_normalized.get("marketType") or detail_normalized.get("topicType")
+    volume_quote = detail_normalized.get("volumeQuoteToken")
+
+    yes_snapshot = _build_token_snapshot(client, detail.get("yes_token_id"))
+    no_snapshot = _build_token_snapshot(client, detail.get("no_token_id"))
+
+    lines = [
+        f"Market {market_id}: {title}",
+        f"  Status: {detail.get('status')} | Type: {market_type} | Cutoff: {detail.get('cutoff_at')}",
+        f"  Quote token: {quote_token} | Fee rate: {fee_rate}",
+        f"  Volume total: {volume} | Volume 24h: {volume24h} | Volume quote token: {volume_quote}",
+        f"  Liquidity: {liquidity} | YES label: {yes_label} | NO label: {no_label}",
+    ]
+    if show_raw_market:
+        lines.append("  Raw market detail:")
+        lines.append(str(detail_normalized))
+        if raw_market_response is not None:
+            lines.append("  Raw market response body:")
+            lines.append(str(raw_market_response))
+
+    for label, snapshot in ("YES", yes_snapshot), ("NO", no_snapshot):
+        if not snapshot:
+            lines.append(f"  {label} token unavailable")
+            continue
+        bids = snapshot["orderbook"].get("bids", [])
+        asks = snapshot["orderbook"].get("asks", [])
+        lines.append(f"  {label} token: {snapshot['token_id']}")
+        lines.append(f"    Bids ({len(bids)}): {bids[:3]}")
+        lines.append(f"    Asks ({len(asks)}): {asks[:3]}")
+        lines.append(f"    Latest price: {snapshot['latest_price']}")
+        # lines.append(f"    History points: {len(snapshot['history'])}")
+        # if snapshot["history"]:
+        #     lines.append(f"    History sample: {snapshot['history'][:3]}")
+        lines.extend(_dump_raw_orderbook(client, snapshot["token_id"], label))
+    lines.append("-" * 80)
+    return "\n".join(lines)
+
+
+def _batched(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 
 def main() -> None:
@@ -56,6 +134,7 @@ def main() -> None:
 
     target_market_ids = os.getenv("MARKET_IDS")
     show_raw_market = os.getenv("SHOW_RAW_MARKET", "0").lower() in {"1", "true", "yes"}
+    concurrency = max(1, int(os.getenv("DUMP_CONCURRENCY", "32")))
     if target_market_ids:
         ids = [int(mid.strip()) for mid in target_market_ids.split(",") if mid.strip()]
         markets: Iterable[Dict[str, Any]] = (
@@ -65,63 +144,21 @@ def main() -> None:
     else:
         markets = client.iter_all_markets(page_size=20)
 
+    def process(market: Dict[str, Any]) -> str:
+        return _process_market(
+            client,
+            market,
+            has_detail=bool(target_market_ids),
+            show_raw_market=show_raw_market,
+        )
+
     total = 0
-    for market in markets:
-        total += 1
-        market_id = market.get("market_id")
-        raw_market_response = None
-        if target_market_ids:
-            detail = market
-            title = market.get("market_title")
-            if show_raw_market:
-                raw_market_response = normalize(client.get_market_raw(int(market_id)))
-        else:
-            title = market.get("market_title")
-            detail = client.get_market(int(market_id))
-            if show_raw_market:
-                raw_market_response = normalize(client.get_market_raw(int(market_id)))
-
-        detail_normalized = normalize(detail)
-        volume = detail_normalized.get("volume")
-        liquidity = detail_normalized.get("liquidity")
-        volume24h = detail_normalized.get("volume24h") or detail_normalized.get("vol24h")
-        fee_rate = detail_normalized.get("feeRate")
-        yes_label = detail_normalized.get("yesLabel") or detail_normalized.get("yes_label")
-        no_label = detail_normalized.get("noLabel") or detail_normalized.get("no_label")
-        quote_token = detail_normalized.get("quoteToken")
-        market_type = detail_normalized.get("marketType") or detail_normalized.get("topicType")
-        volume_quote = detail_normalized.get("volumeQuoteToken")
-
-        yes_snapshot = _build_token_snapshot(client, detail.get("yes_token_id"))
-        no_snapshot = _build_token_snapshot(client, detail.get("no_token_id"))
-
-        print(f"Market {market_id}: {title}")
-        print(f"  Status: {detail.get('status')} | Type: {market_type} | Cutoff: {detail.get('cutoff_at')}")
-        print(f"  Quote token: {quote_token} | Fee rate: {fee_rate}")
-        print(f"  Volume total: {volume} | Volume 24h: {volume24h} | Volume quote token: {volume_quote}")
-        print(f"  Liquidity: {liquidity} | YES label: {yes_label} | NO label: {no_label}")
-        if show_raw_market:
-            print("  Raw market detail:")
-            print(detail_normalized)
-            if raw_market_response is not None:
-                print("  Raw market response body:")
-                print(raw_market_response)
-
-        for label, snapshot in ("YES", yes_snapshot), ("NO", no_snapshot):
-            if not snapshot:
-                print(f"  {label} token unavailable")
-                continue
-            bids = snapshot["orderbook"].get("bids", [])
-            asks = snapshot["orderbook"].get("asks", [])
-            print(f"  {label} token: {snapshot['token_id']}")
-            print(f"    Bids ({len(bids)}): {bids[:3]}")
-            print(f"    Asks ({len(asks)}): {asks[:3]}")
-            print(f"    Latest price: {snapshot['latest_price']}")
-            # print(f"    History points: {len(snapshot['history'])}")
-            # if snapshot["history"]:
-            #     print(f"    History sample: {snapshot['history'][:3]}")
-            _dump_raw_orderbook(client, snapshot["token_id"], label)
-        print("-" * 80)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # map() preserves input order, so each market's block prints intact and in sequence.
+        for batch in _batched(markets, _BATCH_SIZE):
+            for report in executor.map(process, batch):
+                print(report)
+            total += len(batch)
 
     print(f"Total markets processed: {total}")
 
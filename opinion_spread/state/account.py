@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from ..clients.opinion_client import OpinionClient
 from ..models.core import AccountState, OpenOrder, Position
@@ -19,14 +20,41 @@ class AccountCache:
     open_orders: List[OpenOrder]
 
 
+def _parse_position(item: Dict[str, Any]) -> Position:
+    avg_price = item.get("avg_price")
+    return Position(
+        market_id=int(item.get("market_id")),
+        token_id=item["token_id"],
+        outcome_side=item.get("outcome_side_enum", ""),
+        shares=to_decimal(item.get("shares_owned")),
+        average_price=to_decimal(avg_price) if avg_price else None,
+    )
+
+
+def _parse_open_order(item: Dict[str, Any]) -> OpenOrder:
+    return OpenOrder(
+        order_id=item.get("order_id", ""),
+        market_id=int(item.get("market_id", 0)),
+        token_id=item["token_id"],
+        side=item.get("side", ""),
+        price=to_decimal(item.get("price")),
+        remaining=to_decimal(item.get("maker_amount")),
+    )
+
+
 class AccountStateManager:
     def __init__(self, client: OpinionClient):
         self._client = client
 
     def refresh(self) -> AccountState:
-        balances_response = self._client.fetch_balances()
-        positions_response = self._client.fetch_positions()
-        orders_response = self._client.fetch_orders()
+        # The three account endpoints are independent; issue them concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            balances_future = executor.submit(self._client.fetch_balances)
+            positions_future = executor.submit(self._client.fetch_positions)
+            orders_future = executor.submit(self._client.fetch_orders)
+            balances_response = balances_future.result()
+            positions_response = positions_future.result()
+            orders_response = orders_future.result()
 
         total_balances: Dict[str, Decimal] = {}
         available_balances: Dict[str, Decimal] = {}
@@ -38,36 +66,8 @@ class AccountStateManager:
             total_balances[token] = to_decimal(item.get("total_balance"))
             available_balances[token] = to_decimal(item.get("available_balance"))
 
-        positions: List[Position] = []
-        for pos in positions_response:
-            token_id = pos.get("token_id")
-            if not token_id:
-                continue
-            positions.append(
-                Position(
-                    market_id=int(pos.get("market_id")),
-                    token_id=token_id,
-                    outcome_side=pos.get("outcome_side_enum", ""),
-                    shares=to_decimal(pos.get("shares_owned")),
-                    average_price=(to_decimal(pos.get("avg_price")) if pos.get("avg_price") else None),
-                )
-            )
-
-        open_orders: List[OpenOrder] = []
-        for order in orders_response:
-            token_id = order.get("token_id")
-            if not token_id:
-                continue
-            open_orders.append(
-                OpenOrder(
-                    order_id=order.get("order_id", ""),
-                    market_id=int(order.get("market_id", 0)),
-                    token_id=token_id,
-                    side=order.get("side", ""),
-                    price=to_decimal(order.get("price")),
-                    remaining=to_decimal(order.get("maker_amount")),
-                )
-            )
+        positions = [_parse_position(item) for item in positions_response if item.get("token_id")]
+        open_orders = [_parse_open_order(item) for item in orders_response if item.get("token_id")]
 
         return AccountState(
             total_balances=total_balances,
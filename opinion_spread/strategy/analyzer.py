@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..clients.opinion_client import OpinionClient
 from ..config.schema import StrategyConfig
 from ..models.core import OrderbookLevel, OrderbookSnapshot, TokenMetrics
-from ..utils.decimal_utils import safe_div, to_decimal
+from ..utils.decimal_utils import to_decimal
+
+
+_TOKEN_SIDES = (("yes_token_id", "yes"), ("no_token_id", "no"))
+
+
+def _parse_levels(levels: Iterable[Dict[str, str]]) -> List[OrderbookLevel]:
+    convert = to_decimal
+    level_cls = OrderbookLevel
+    return [level_cls(price=convert(level["price"]), size=convert(level["size"])) for level in levels]
 
 
 @dataclass
@@ -24,32 +35,26 @@ class SpreadAnalyzer:
     def __init__(self, client: OpinionClient, config: StrategyConfig):
         self._client = client
         self._config = config
+        self._min_liquidity = Decimal(str(config.min_liquidity))
+        self._max_spread = Decimal(str(config.max_spread))
+        # Compare bid + ask with the doubled price band rather than dividing for the mid price.
+        self._min_price_sum = Decimal(str(config.min_price)) * 2
+        self._max_price_sum = Decimal(str(config.max_price)) * 2
 
     def _build_orderbook(self, token_id: str, data: Dict[str, Iterable[Dict[str, str]]]) -> OrderbookSnapshot:
-        bids = [
-            OrderbookLevel(price=to_decimal(level["price"]), size=to_decimal(level["size"]))
-            for level in data.get("bids", [])
-        ]
-        asks = [
-            OrderbookLevel(price=to_decimal(level["price"]), size=to_decimal(level["size"]))
-            for level in data.get("asks", [])
-        ]
-        return OrderbookSnapshot(token_id=token_id, bids=bids, asks=asks)
-
-    def _calculate_metrics(self, orderbook: OrderbookSnapshot, market_id: int, side: str) -> TokenMetrics:
-        best_bid = orderbook.best_bid()
-        best_ask = orderbook.best_ask()
-        spread: Optional[Decimal] = None
-        if best_bid and best_ask:
-            spread = best_ask.price - best_bid.price
+        return OrderbookSnapshot(
+            token_id=token_id,
+            bids=_parse_levels(data.get("bids", ())),
+            asks=_parse_levels(data.get("asks", ())),
+        )
 
-        liquidity_candidates: List[Decimal] = []
-        if best_bid:
-            liquidity_candidates.append(best_bid.size)
-        if best_ask:
-            liquidity_candidates.append(best_ask.size)
+    def _calculate_metrics(self, orderbook: OrderbookSnapshot, market_id: int, side: str) -> Optional[TokenMetrics]:
+        """Return metrics for a two-sided book, or None when either side is empty."""
 
-        liquidity = min(liquidity_candidates) if liquidity_candidates else Decimal("0")
+        best_bid = orderbook.best_bid()
+        best_ask = orderbook.best_ask()
+        if best_bid is None or best_ask is None:
+            return None
 
         return TokenMetrics(
             token_id=orderbook.token_id,
@@ -57,36 +62,63 @@ class SpreadAnalyzer:
             side=side,
             best_bid=best_bid,
             best_ask=best_ask,
-            spread=spread,
-            liquidity_score=liquidity,
+            spread=best_ask.price - best_bid.price,
+            liquidity_score=min(best_bid.size, best_ask.size),
         )
 
+    def _token_slots(self, markets: Iterable[Dict[str, Any]]) -> List[Tuple[int, str, str]]:
+        slots: List[Tuple[int, str, str]] = []
+        for market in markets:
+            market_id = int(market.get("market_id"))
+            for side_key, side in _TOKEN_SIDES:
+                token_id = market.get(side_key)
+                if token_id:
+                    slots.append((market_id, side, token_id))
+        return slots
+
+    def _fetch_orderbooks(self, token_ids: List[str]) -> List[Dict[str, Any]]:
+        workers = min(self._config.orderbook_concurrency, len(token_ids))
+        if workers <= 1:
+            return [self._client.fetch_orderbook(token_id) for token_id in token_ids]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._client.fetch_orderbook, token_ids))
+
+    def analyze_markets(self, markets: Iterable[Dict[str, Any]]) -> List[TokenMetrics]:
+        """Fetch every YES/NO orderbook of ``markets`` concurrently and compute metrics.
+
+        Tokens whose book lacks bids or asks are left out.
+        """
+
+        slots = self._token_slots(markets)
+        orderbooks = self._fetch_orderbooks([token_id for _, _, token_id in slots])
+        metrics = (
+            self._calculate_metrics(self._build_orderbook(token_id, data), market_id, side)
+            for (market_id, side, token_id), data in zip(slots, orderbooks)
+        )
+        return [metric for metric in metrics if metric is not None]
+
     def analyze_market(self, market: Dict[str, Any]) -> List[TokenMetrics]:
-        metrics: List[TokenMetrics] = []
-        for side_key in ("yes_token_id", "no_token_id"):
-            token_id = market.get(side_key)
-            if not token_id:
-                continue
-            orderbook_data = self._client.fetch_orderbook(token_id)
-            orderbook = self._build_orderbook(token_id, orderbook_data)
-            side = "yes" if side_key.startswith("yes") else "no"
-            metric = self._calculate_metrics(orderbook, int(market.get("market_id")), side)
-            metrics.append(metric)
-        return metrics
+        return self.analyze_markets([market])
 
     def select_top_tokens(self, markets: Iterable[Dict[str, Any]]) -> List[TokenMetrics]:
+        min_liquidity = self._min_liquidity
+        max_spread = self._max_spread
+        min_price_sum = self._min_price_sum
+        max_price_sum = self._max_price_sum
+
         candidates: List[TokenMetrics] = []
-        for market in markets:
-            metrics = self.analyze_market(market)
-            for metric in metrics:
-                if metric.best_bid and metric.best_ask:
-                    if metric.liquidity_score < Decimal(str(self._config.min_liquidity)):
-                        continue
-                    if metric.spread is None or metric.spread > Decimal(str(self._config.max_spread)):
-                        continue
-                    price_mid = safe_div(metric.best_bid.price + metric.best_ask.price, Decimal("2"))
-                    if not (Decimal(str(self._config.min_price)) <= price_mid <= Decimal(str(self._config.max_price))):
-                        continue
-                    candidates.append(metric)
-        candidates.sort(key=lambda m: (m.spread or Decimal("1"), -m.liquidity_score))
-        return candidates[: self._config.top_n_tokens]
+        # analyze_markets only yields two-sided books, so best_bid/best_ask/spread are set.
+        for metric in self.analyze_markets(markets):
+            if metric.liquidity_score < min_liquidity:
+                continue
+            if metric.spread > max_spread:
+                continue
+            if not (min_price_sum <= metric.best_bid.price + metric.best_ask.price <= max_price_sum):
+                continue
+            candidates.append(metric)
+        # nsmallest keeps the same stable ordering as sorted()[:n] without sorting every candidate.
+        return heapq.nsmallest(
+            self._config.top_n_tokens,
+            candidates,
+            key=lambda m: (m.spread or Decimal("1"), -m.liquidity_score),
+        )
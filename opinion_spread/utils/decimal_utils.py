@@ -2,40 +2,72 @@
 
 from __future__ import annotations
 
-from decimal import Decimal, ROUND_DOWN, getcontext
+from decimal import Context, Decimal, ROUND_DOWN
+from functools import lru_cache
 from typing import Any
 
-getcontext().prec = 28
+# Private context for rounding so importing this module does not touch the thread's global context.
+_CTX = Context(prec=28, rounding=ROUND_DOWN)
 
 
+ZERO = Decimal(0)
 FOUR_DP = Decimal("0.0001")
 TWO_DP = Decimal("0.01")
 
 
-def to_decimal(value: Any, default: Decimal = Decimal("0")) -> Decimal:
+@lru_cache(maxsize=4096)
+def _parse_decimal(text: str) -> Decimal:
+    # Orderbooks and balances repeat the same few price strings; Decimal is immutable so sharing is safe.
+    return Decimal(text)
+
+
+def to_decimal(value: Any, default: Decimal = ZERO) -> Decimal:
     if value is None:
         return default
     if isinstance(value, Decimal):
         return value
-    if isinstance(value, (int, float)):
-        return Decimal(str(value))
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        # str() gives the shortest repr, so 0.1 becomes Decimal("0.1") rather than its binary expansion.
+        return _parse_decimal(str(value))
     if isinstance(value, str):
         value = value.strip()
         if not value:
             return default
-        return Decimal(value)
+        return _parse_decimal(value)
     raise TypeError(f"Unsupported value type for Decimal conversion: {type(value)!r}")
 
 
 def quantize_down(value: Decimal, step: Decimal = FOUR_DP) -> Decimal:
-    return value.quantize(step, rounding=ROUND_DOWN)
+    if value.same_quantum(step):
+        # Already at the step's exponent; ROUND_DOWN would return it unchanged.
+        return value
+    return _CTX.quantize(value, step)
+
+
+def quantize_4dp(value: Decimal) -> Decimal:
+    """quantize_down specialised for the default FOUR_DP step."""
+
+    if value.same_quantum(FOUR_DP):
+        return value
+    return _CTX.quantize(value, FOUR_DP)
+
+
+def div_down(numerator: Decimal, denominator: Decimal, places: int = 4) -> Decimal:
+    """Divide positive Decimals and round down to ``places`` decimals using exact integer math."""
+
+    num_n, num_d = numerator.as_integer_ratio()
+    den_n, den_d = denominator.as_integer_ratio()
+    units = (num_n * den_d * 10**places) // (num_d * den_n)
+    return Decimal(units).scaleb(-places)
 
 
 def format_decimal(value: Decimal, step: Decimal = FOUR_DP) -> str:
+    if step is FOUR_DP:
+        return str(quantize_4dp(value))
     return str(quantize_down(value, step))
 
 
-def safe_div(numerator: Decimal, denominator: Decimal, default: Decimal = Decimal("0")) -> Decimal:
-    if denominator == 0:
-        return default
-    return numerator / denominator
+def safe_div(numerator: Decimal, denominator: Decimal, default: Decimal = ZERO) -> Decimal:
+    return numerator / denominator if denominator else default
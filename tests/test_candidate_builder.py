@@ -7,7 +7,7 @@ from decimal import Decimal
 from opinion_spread.config.schema import StrategyConfig
 from opinion_spread.models.core import AccountState, OpenOrder, OrderCandidate, Position, TokenMetrics
 from opinion_spread.strategy.candidates import CandidateBuilder
-from opinion_spread.utils.decimal_utils import to_decimal
+from opinion_spread.utils.decimal_utils import ZERO, to_decimal
 
 
 def make_account(positions=None, open_orders=None) -> AccountState:
@@ -71,3 +71,22 @@ def test_candidate_builds_orders_with_quote_amount() -> None:
     assert candidate.quote_amount == Decimal("20")
     assert candidate.base_amount > 0
     assert candidate.price == Decimal("0.4")
+
+
+def test_candidate_base_amount_rounds_down_to_four_places() -> None:
+    builder = CandidateBuilder(StrategyConfig(order_quote_amount=10))
+    level = type("L", (), {"price": Decimal("0.3"), "size": Decimal("10")})()
+    metrics = [
+        TokenMetrics(
+            token_id="token-no",
+            market_id=2,
+            side="no",
+            best_bid=level,
+            best_ask=level,
+            spread=ZERO,
+            liquidity_score=Decimal("10"),
+        )
+    ]
+
+    candidates = builder.build_buy_candidates(metrics, make_account())
+    assert [str(candidate.base_amount) for candidate in candidates] == ["33.3333"]
@@ -0,0 +1,68 @@
+"""Tests for copying and pickling the frozen model dataclasses."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from datetime import datetime
+from decimal import Decimal
+
+from opinion_spread.models.core import AccountState, OpenOrder, OrderCandidate, Position
+from opinion_spread.risk.checks import RiskDecision
+
+
+def make_order() -> OpenOrder:
+    return OpenOrder(
+        order_id="o-1",
+        market_id=1,
+        token_id="token-1",
+        side="BUY",
+        price=Decimal("0.4"),
+        remaining=Decimal("10"),
+    )
+
+
+def make_candidate() -> OrderCandidate:
+    return OrderCandidate(
+        market_id=1,
+        token_id="token-1",
+        side="buy",
+        price=Decimal("0.4"),
+        quote_amount=Decimal("20"),
+        base_amount=Decimal("50.0000"),
+    )
+
+
+def test_frozen_models_round_trip_through_copy_and_pickle() -> None:
+    candidate = make_candidate()
+    decision = RiskDecision(
+        candidate=candidate,
+        available_quote=Decimal("80"),
+        total_position=Decimal("50"),
+        market_position=Decimal("50"),
+        duplicate_key=(1, "token-1", "buy", Decimal("0.4")),
+        timestamp=datetime(2024, 1, 1),
+    )
+    for original in (make_order(), candidate, decision):
+        assert copy.copy(original) == original
+        assert copy.deepcopy(original) == original
+        assert pickle.loads(pickle.dumps(original)) == original
+
+
+def test_account_state_deepcopies_with_models() -> None:
+    position = Position(
+        market_id=1,
+        token_id="token-1",
+        outcome_side="yes",
+        shares=Decimal("5"),
+        average_price=None,
+    )
+    account = AccountState(
+        total_balances={"USDT": Decimal("100")},
+        available_balances={"USDT": Decimal("100")},
+        positions=[position],
+        open_orders=[make_order()],
+    )
+    clone = copy.deepcopy(account)
+    assert clone == account
+    assert clone.open_buy_token_ids == frozenset({"token-1"})
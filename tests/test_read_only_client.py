@@ -96,3 +96,64 @@ def test_error_raises_runtime(monkeypatch: pytest.MonkeyPatch) -> None:
 
     with pytest.raises(RuntimeError):
         client.get_markets()
+
+
+def test_iter_all_markets_keeps_page_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _mock_client(*args: Any, **kwargs: Any) -> DummySDKClient:
+        return sdk
+
+    class PagedSDKClient(DummySDKClient):
+        def get_markets(self, **kwargs: Any) -> DummyResponse:
+            page, limit = kwargs["page"], kwargs["limit"]
+            size = limit if page < 3 else 1
+            rows = [{"market_id": (page - 1) * limit + i} for i in range(size)]
+            return DummyResponse(errno=0, result=DummyResult(list_=rows))
+
+    sdk = PagedSDKClient()
+    monkeypatch.setattr("opinion_spread.clients.read_only_client.OpinionSDKClient", _mock_client)
+    client = OpinionReadOnlyClient(ReadOnlyConfig(host="https://proxy.opinion.trade:8443", api_key="test"))
+
+    markets = list(client.iter_all_markets(page_size=2, prefetch=3))
+    assert [market["market_id"] for market in markets] == [0, 1, 2, 3, 4]
+
+
+def test_iter_all_markets_reuses_recent_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _mock_client(*args: Any, **kwargs: Any) -> DummySDKClient:
+        return sdk
+
+    class CountingSDKClient(DummySDKClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        def get_markets(self, **kwargs: Any) -> DummyResponse:
+            self.calls += 1
+            return super().get_markets(**kwargs)
+
+    sdk = CountingSDKClient()
+    monkeypatch.setattr("opinion_spread.clients.read_only_client.OpinionSDKClient", _mock_client)
+    client = OpinionReadOnlyClient(ReadOnlyConfig(host="https://proxy.opinion.trade:8443", api_key="test"))
+
+    assert list(client.iter_all_markets(prefetch=1)) == [{"market_id": 1}]
+    assert list(client.iter_all_markets(prefetch=1)) == [{"market_id": 1}]
+    assert sdk.calls == 1
+
+
+def test_cached_market_pages_are_isolated_and_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _mock_client(*args: Any, **kwargs: Any) -> DummySDKClient:
+        return DummySDKClient()
+
+    monkeypatch.setattr("opinion_spread.clients.read_only_client.OpinionSDKClient", _mock_client)
+    client = OpinionReadOnlyClient(ReadOnlyConfig(host="https://proxy.opinion.trade:8443", api_key="test"))
+
+    first = list(client.iter_all_markets(prefetch=1))
+    first[0]["market_id"] = 99
+    assert list(client.iter_all_markets(prefetch=1)) == [{"market_id": 1}]
+
+    clock = [1000.0]
+    monkeypatch.setattr("opinion_spread.clients.read_only_client.time.monotonic", lambda: clock[0])
+    client._markets_cache.clear()
+    list(client.iter_all_markets(prefetch=1, status="old"))
+    clock[0] += 10.0
+    list(client.iter_all_markets(prefetch=1))
+    assert all("old" not in str(key) for key in client._markets_cache)
@@ -0,0 +1,50 @@
+"""Tests for SDK response normalization helpers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+
+from opinion_spread.clients._response_utils import normalize
+
+
+class Side(Enum):
+    BUY = 1
+    SELL = 2
+
+
+@dataclass
+class Level:
+    price: Decimal
+    size: Decimal
+
+
+class SDKRow:
+    def __init__(self, market_id: int, side: Side) -> None:
+        self.market_id = market_id
+        self.side = side
+        self._private = "hidden"
+
+
+def test_normalize_nested_structures() -> None:
+    payload = {
+        "levels": (Level(price=Decimal("0.5"), size=Decimal("10")),),
+        "side": Side.SELL,
+        "tags": ["a", None, 1],
+    }
+    assert normalize(payload) == {
+        "levels": [{"price": "0.5", "size": "10"}],
+        "side": 2,
+        "tags": ["a", None, 1],
+    }
+
+
+def test_normalize_plain_objects_repeatedly() -> None:
+    rows = [SDKRow(1, Side.BUY), SDKRow(2, Side.SELL)]
+    assert normalize(rows) == [
+        {"market_id": 1, "side": 1},
+        {"market_id": 2, "side": 2},
+    ]
+    # Second pass goes through the memoized handler for SDKRow.
+    assert normalize(rows[0]) == {"market_id": 1, "side": 1}
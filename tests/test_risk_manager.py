@@ -130,3 +130,42 @@ def test_sell_order_within_limits(risk_config: RiskConfig) -> None:
 
     assert manager._total_position == Decimal("5")  # type: ignore[attr-defined]
     assert manager._position_by_market[candidate.market_id] == Decimal("5")  # type: ignore[attr-defined]
+
+
+def test_expired_duplicate_keys_are_pruned(risk_config: RiskConfig) -> None:
+    manager = RiskManager(risk_config)
+    manager.reset(make_account())
+
+    first = manager.evaluate(
+        OrderCandidate(
+            market_id=1,
+            token_id="token-1",
+            side="buy",
+            price=Decimal("0.4"),
+            quote_amount=Decimal("20"),
+            base_amount=Decimal("50"),
+        )
+    )
+    manager.commit(first)
+
+    later = manager.evaluate(
+        OrderCandidate(
+            market_id=2,
+            token_id="token-2",
+            side="buy",
+            price=Decimal("0.4"),
+            quote_amount=Decimal("20"),
+            base_amount=Decimal("50"),
+        )
+    )
+    later = RiskDecision(
+        candidate=later.candidate,
+        available_quote=later.available_quote,
+        total_position=later.total_position,
+        market_position=later.market_position,
+        duplicate_key=later.duplicate_key,
+        timestamp=first.timestamp + timedelta(seconds=risk_config.duplicate_order_cooldown),
+    )
+    manager.commit(later)
+
+    assert list(manager._last_order_times) == [later.duplicate_key]  # type: ignore[attr-defined]
@@ -0,0 +1,115 @@
+"""Tests for automatic sell order management."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from opinion_spread.clients.opinion_client import OrderPlacementResult
+from opinion_spread.config.schema import RiskConfig
+from opinion_spread.executors.orders import SellOrderManager
+from opinion_spread.models.core import AccountState, OpenOrder, Position
+from opinion_spread.risk.checks import RiskManager
+
+
+class DummyClient:
+    def __init__(self, asks: Dict[str, List[Dict[str, str]]]) -> None:
+        self._asks = asks
+        self.orderbook_requests: List[str] = []
+        self.placed: List[Dict[str, Any]] = []
+
+    def fetch_orderbook(self, token_id: str) -> Dict[str, Any]:
+        self.orderbook_requests.append(token_id)
+        return {"bids": [], "asks": self._asks.get(token_id, [])}
+
+    def place_limit_order(self, **kwargs: Any) -> OrderPlacementResult:
+        self.placed.append(kwargs)
+        return OrderPlacementResult(order_id=f"order-{len(self.placed)}", payload={})
+
+
+def make_position(market_id: int, token_id: str, shares: str) -> Position:
+    return Position(
+        market_id=market_id,
+        token_id=token_id,
+        outcome_side="yes",
+        shares=Decimal(shares),
+        average_price=Decimal("0.5"),
+    )
+
+
+def test_manage_places_sells_for_uncovered_positions() -> None:
+    risk_config = RiskConfig(sell_order_threshold=5)
+    client = DummyClient(
+        asks={
+            "token-1": [{"price": "0.6", "size": "100"}],
+            "token-3": [{"price": "0.7", "size": "100"}],
+        }
+    )
+    account = AccountState(
+        total_balances={"USDT": Decimal("100")},
+        available_balances={"USDT": Decimal("100")},
+        positions=[
+            make_position(1, "token-1", "20"),
+            make_position(2, "token-2", "20"),
+            make_position(3, "token-3", "20"),
+            make_position(4, "token-4", "3"),
+        ],
+        open_orders=[
+            OpenOrder(
+                order_id="existing",
+                market_id=2,
+                token_id="token-2",
+                side="SELL",
+                price=Decimal("0.5"),
+                remaining=Decimal("18"),
+            )
+        ],
+    )
+    risk_manager = RiskManager(risk_config)
+    risk_manager.reset(account)
+    manager = SellOrderManager(client, risk_manager, risk_config)  # type: ignore[arg-type]
+
+    summary = manager.manage(account)
+
+    assert sorted(client.orderbook_requests) == ["token-1", "token-3"]
+    assert [order["token_id"] for order in client.placed] == ["token-1", "token-3"]
+    assert client.placed[0]["price"] == "0.6"
+    assert client.placed[0]["amount_in_base"] == "20.0000"
+    assert summary["sell_orders_considered"] == 2.0
+    assert summary["sell_orders_success"] == 2.0
+
+
+def test_manage_keeps_selling_when_one_orderbook_fetch_fails() -> None:
+    class FlakyClient(DummyClient):
+        def fetch_orderbook(self, token_id: str) -> Dict[str, Any]:
+            if token_id == "token-3":
+                raise RuntimeError("orderbook unavailable")
+            return super().fetch_orderbook(token_id)
+
+    risk_config = RiskConfig(sell_order_threshold=5)
+    client = FlakyClient(
+        asks={
+            "token-1": [{"price": "0.6", "size": "100"}],
+            "token-2": [{"price": "0.65", "size": "100"}],
+        }
+    )
+    account = AccountState(
+        total_balances={"USDT": Decimal("100")},
+        available_balances={"USDT": Decimal("100")},
+        positions=[
+            make_position(1, "token-1", "20"),
+            make_position(2, "token-2", "20"),
+            make_position(3, "token-3", "20"),
+        ],
+        open_orders=[],
+    )
+    risk_manager = RiskManager(risk_config)
+    risk_manager.reset(account)
+    manager = SellOrderManager(client, risk_manager, risk_config)  # type: ignore[arg-type]
+
+    summary = manager.manage(account)
+
+    assert [order["token_id"] for order in client.placed] == ["token-1", "token-2"]
+    assert summary["sell_orders_considered"] == 3.0
+    assert summary["sell_orders_success"] == 2.0
+    assert summary["sell_orders_failed"] == 1.0
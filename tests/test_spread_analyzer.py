@@ -0,0 +1,56 @@
+"""Tests for market analysis and token selection."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from opinion_spread.config.schema import StrategyConfig
+from opinion_spread.strategy.analyzer import SpreadAnalyzer
+
+
+class DummyClient:
+    def __init__(self, books: Dict[str, Dict[str, List[Dict[str, str]]]]) -> None:
+        self._books = books
+
+    def fetch_orderbook(self, token_id: str) -> Dict[str, Any]:
+        return self._books.get(token_id, {"bids": [], "asks": []})
+
+
+def book(bid: str, ask: str, size: str = "50") -> Dict[str, List[Dict[str, str]]]:
+    return {"bids": [{"price": bid, "size": size}], "asks": [{"price": ask, "size": size}]}
+
+
+def test_select_top_tokens_filters_and_ranks() -> None:
+    client = DummyClient(
+        {
+            "yes-1": book("0.40", "0.45"),
+            "no-1": book("0.50", "0.70"),  # spread too wide
+            "yes-2": book("0.30", "0.32"),
+            "no-2": book("0.01", "0.02"),  # mid price below band
+            "yes-3": book("0.60", "0.62", size="5"),  # not enough liquidity
+            "yes-4": book("0.50", "0.60"),  # spread exactly at the limit
+        }
+    )
+    analyzer = SpreadAnalyzer(client, StrategyConfig(max_spread=0.1, top_n_tokens=2))  # type: ignore[arg-type]
+    markets = [
+        {"market_id": 1, "yes_token_id": "yes-1", "no_token_id": "no-1"},
+        {"market_id": 2, "yes_token_id": "yes-2", "no_token_id": "no-2"},
+        {"market_id": 3, "yes_token_id": "yes-3"},
+        {"market_id": 4, "yes_token_id": "yes-4", "no_token_id": "no-4"},
+    ]
+
+    selected = analyzer.select_top_tokens(markets)
+
+    assert [metric.token_id for metric in selected] == ["yes-2", "yes-1"]
+    assert selected[0].spread == Decimal("0.02")
+    assert selected[0].side == "yes"
+
+
+def test_select_top_tokens_keeps_spread_at_limit() -> None:
+    client = DummyClient({"yes-4": book("0.50", "0.60")})
+    analyzer = SpreadAnalyzer(client, StrategyConfig(max_spread=0.1))  # type: ignore[arg-type]
+
+    selected = analyzer.select_top_tokens([{"market_id": 4, "yes_token_id": "yes-4"}])
+
+    assert [metric.token_id for metric in selected] == ["yes-4"]